@@ -89,7 +89,9 @@ class SimpleVocabulary(Estimator):
 
     def __call__(self, batch, is_top=True, **kwargs):
         if isinstance(batch, Iterable) and not isinstance(batch, str):
-            looked_up_batch = [self(sample, is_top=False) for sample in batch]
+            # look up leaf tokens directly instead of recursing once per token
+            looked_up_batch = [self[sample] if isinstance(sample, str) or not isinstance(sample, Iterable)
+                               else self(sample, is_top=False) for sample in batch]
         else:
             return self[batch]
         if self._pad_with_zeros and is_top and not is_str_batch(looked_up_batch):
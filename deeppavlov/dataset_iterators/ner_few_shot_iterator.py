@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import re
 from typing import List, Dict, Tuple, Any, Iterator, Optional
 
 import numpy as np
@@ -61,7 +60,7 @@ class NERFewShotIterator(DataLearningIterator):
         if self.filter_bi:
             for key in self.data:
                 for n, (x, y) in enumerate(self.data[key]):
-                    self.data[key][n] = [x, [re.sub('(B-|I-)', '', tag) for tag in y]]
+                    self.data[key][n] = [x, [tag[2:] if tag[:2] in ('B-', 'I-') else tag for tag in y]]
 
         self.tag_map = np.zeros(self.n_samples, dtype=bool)
         for n, (toks, tags) in enumerate(self.data['train']):
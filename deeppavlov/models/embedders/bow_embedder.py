@@ -35,24 +35,27 @@ class BoWEmbedder(Component):
 
             >>> bow = BoWEmbedder(depth=3)
 
-            >>> bow([[0, 1], [1], [])
-            [array([1, 1, 0], dtype=int32),
-             array([0, 1, 0], dtype=int32),
-             array([0, 0, 0], dtype=int32)]
+            >>> bow([[0, 1], [1], []])
+            array([[1, 1, 0],
+                   [0, 1, 0],
+                   [0, 0, 0]], dtype=int32)
     """
 
     def __init__(self, depth: int, with_counts: bool = False, **kwargs) -> None:
         self.depth = depth
         self.with_counts = with_counts
 
-    def _encode(self, token_indices: List[int]) -> np.ndarray:
-        bow = np.zeros([self.depth], dtype=np.int32)
-        for idx in token_indices:
-            if self.with_counts:
-                bow[idx] += 1
-            else:
-                bow[idx] = 1
+    def _encode(self, token_indices: List[int], bow: np.ndarray) -> np.ndarray:
+        token_indices = np.asarray(token_indices, dtype=np.intp)
+        if self.with_counts:
+            np.add.at(bow, token_indices, 1)
+        else:
+            bow[token_indices] = 1
         return bow
 
-    def __call__(self, batch: List[List[int]]) -> List[np.ndarray]:
-        return [self._encode(sample) for sample in batch]
+    def __call__(self, batch: List[List[int]]) -> np.ndarray:
+        # rows of a single preallocated array instead of one array per sample
+        bows = np.zeros([len(batch), self.depth], dtype=np.int32)
+        for sample, bow in zip(batch, bows):
+            self._encode(sample, bow)
+        return bows
@@ -44,10 +44,11 @@ class NLGManager(NLGManagerInterface):
         template_path = expand_path(template_path)
         template_type = getattr(go_bot_templates, template_type)
         self.templates = go_bot_templates.Templates(template_type).load(template_path)
+        self.actions2ids = {action: action_idx for action_idx, action in enumerate(self.templates.actions)}
 
         self._api_call_id = -1
         if api_call_action is not None:
-            self._api_call_id = self.templates.actions.index(api_call_action)
+            self._api_call_id = self.actions2ids[api_call_action]
 
         if self.debug:
             log.debug(f"AFTER {self.__class__.__name__} init(): "
@@ -63,7 +64,7 @@ class NLGManager(NLGManagerInterface):
         Returns:
             an ID corresponding to the passed action text
         """
-        return self.templates.actions.index(action_text)  # todo unhandled exception when not found
+        return self.actions2ids[action_text]  # todo unhandled exception when not found
 
     def get_api_call_action_id(self) -> int:
         """
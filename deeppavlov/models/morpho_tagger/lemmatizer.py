@@ -66,7 +66,10 @@ class BasicLemmatizer(Serializable):
             raise ValueError("There must be the same number of tag sentences as the number of word sentences.")
         if any((len(elem[0]) != len(elem[1])) for elem in zip(data, tags)):
             raise ValueError("Tag sentence must be of the same length as the word sentence.")
-        answer = [[self._lemmatize(word, tag) for word, tag in zip(*elem)] for elem in zip(data, tags)]
+        # each distinct (word, tag) pair is lemmatized only once per batch
+        lemmas = {pair: self._lemmatize(*pair) for pair in
+                  dict.fromkeys(pair for elem in zip(data, tags) for pair in zip(*elem))}
+        answer = [[lemmas[pair] for pair in zip(*elem)] for elem in zip(data, tags)]
         return answer
 
 
@@ -100,6 +103,12 @@ class UDPymorphyLemmatizer(BasicLemmatizer):
         if lemma is not None:
             return lemma
         parses = self.analyzer.parse(word)
+        # tag conversion and comparison only matter when the parses disagree on the lemma
+        normal_forms = {parse.normal_form for parse in parses}
+        if len(normal_forms) == 1:
+            best_lemma = normal_forms.pop()
+            self.memo[(word, tag)] = best_lemma
+            return best_lemma
         best_lemma, best_distance = word, np.inf
         for i, parse in enumerate(parses):
             curr_tag, curr_lemma = self.converter(str(parse.tag)), parse.normal_form
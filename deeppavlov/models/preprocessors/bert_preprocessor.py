@@ -12,10 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import re
-import random
 from logging import getLogger
 from typing import Tuple, List, Optional, Union
 
+import numpy as np
 from bert_dp.preprocessing import convert_examples_to_features, InputExample, InputFeatures
 from bert_dp.tokenization import FullTokenizer
 
@@ -189,7 +189,12 @@ class BertNerPreprocessor(Component):
         tokens_subword = ['[CLS]']
         startofword_markers = [0]
         tags_subword = ['X']
-        for token, tag in zip(tokens, tags):
+        if do_masking:
+            # one vectorized draw per sentence instead of one per token
+            masked_tokens = (np.random.random(len(tokens)) < token_masking_prob).tolist()
+        else:
+            masked_tokens = [False] * len(tokens)
+        for token, tag, masked in zip(tokens, tags, masked_tokens):
             token_marker = int(tag != 'X')
             subwords = tokenizer.tokenize(token)
             if not subwords or (do_cutting and (len(subwords) > max_subword_len)):
@@ -197,7 +202,7 @@ class BertNerPreprocessor(Component):
                 startofword_markers.append(token_marker)
                 tags_subword.append(tag)
             else:
-                if do_masking and (random.random() < token_masking_prob):
+                if masked:
                     tokens_subword.extend(['[MASK]'] * len(subwords))
                 else:
                     tokens_subword.extend(subwords)
@@ -18,7 +18,6 @@ from typing import Tuple, List, Optional
 import numpy as np
 
 from deeppavlov.core.common.registry import register
-from deeppavlov.core.data.utils import zero_pad
 from deeppavlov.core.models.component import Component
 
 
@@ -47,30 +46,42 @@ class CapitalizationPreprocessor(Component):
     def dim(self):
         return self._num_of_features
 
+    @staticmethod
+    def _feature_index(token: str) -> Optional[int]:
+        # Check the case and return the index of the corresponding one-hot component
+        if len(token) > 0:
+            if token[0].islower():
+                return 0
+            elif len(token) == 1 and token[0].isupper():
+                return 1
+            elif len(token) > 1 and token[0].isupper() and any(ch.islower() for ch in token):
+                return 2
+            elif all(ch.isupper() for ch in token):
+                return 3
+        return None
+
     def __call__(self, tokens_batch, **kwargs):
+        if self.pad_zeros:
+            # fill one preallocated batch tensor instead of padding per-token arrays
+            max_batch_len = max((len(utterance) for utterance in tokens_batch), default=0)
+            cap_batch = np.zeros([len(tokens_batch), max_batch_len, self._num_of_features], np.float32)
+            for i, utterance in enumerate(tokens_batch):
+                for j, token in enumerate(utterance):
+                    idx = self._feature_index(token)
+                    if idx is not None:
+                        cap_batch[i, j, idx] = 1
+            return cap_batch
         cap_batch = []
-        max_batch_len = 0
         for utterance in tokens_batch:
             cap_list = []
-            max_batch_len = max(max_batch_len, len(utterance))
             for token in utterance:
-                cap = np.zeros(4, np.float32)
-                # Check the case and produce corresponding one-hot
-                if len(token) > 0:
-                    if token[0].islower():
-                        cap[0] = 1
-                    elif len(token) == 1 and token[0].isupper():
-                        cap[1] = 1
-                    elif len(token) > 1 and token[0].isupper() and any(ch.islower() for ch in token):
-                        cap[2] = 1
-                    elif all(ch.isupper() for ch in token):
-                        cap[3] = 1
+                cap = np.zeros(self._num_of_features, np.float32)
+                idx = self._feature_index(token)
+                if idx is not None:
+                    cap[idx] = 1
                 cap_list.append(cap)
             cap_batch.append(cap_list)
-        if self.pad_zeros:
-            return zero_pad(cap_batch)
-        else:
-            return cap_batch
+        return cap_batch
 
 
 def process_word(word: str, to_lower: bool = False,
@@ -61,7 +61,7 @@ class NerPreprocessor():
 
         if self.get_x_cap_padded:
             cap_seq = [[self.encode_cap(token) for token in sent] for sent in batch]
-            x_cap_padded = np.zeros((len(batch), max_len))
+            x_cap_padded = np.zeros((len(batch), max_len), dtype=np.int32)
             for i, caps in enumerate(cap_seq):
                 x_cap_padded[i, :len(caps)] = caps
             ret += (x_cap_padded,)
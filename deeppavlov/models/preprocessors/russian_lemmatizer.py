@@ -24,6 +24,7 @@ class PymorphyRussianLemmatizer(Component):
 
     def __init__(self, *args, **kwargs):
         self.lemmatizer = pymorphy2.MorphAnalyzer()
+        self.tok2lemma = {}
 
     def __call__(self, tokens_batch, **kwargs):
         """Takes batch of tokens and returns the lemmatized tokens."""
@@ -31,7 +32,11 @@ class PymorphyRussianLemmatizer(Component):
         for utterance in tokens_batch:
             lemma_utterance = []
             for token in utterance:
-                p = self.lemmatizer.parse(token)[0]
-                lemma_utterance.append(p.normal_form)
+                try:
+                    lemma = self.tok2lemma[token]
+                except KeyError:
+                    lemma = self.lemmatizer.parse(token)[0].normal_form
+                    self.tok2lemma[token] = lemma
+                lemma_utterance.append(lemma)
             lemma_batch.append(lemma_utterance)
         return lemma_batch
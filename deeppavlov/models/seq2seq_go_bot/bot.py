@@ -68,6 +68,7 @@ class Seq2SeqGoalOrientedBot(NNModel):
         self.tgt_vocab_size = len(target_vocab)
         self.kb_keys = knowledge_base_keys
         self.kb_size = len(self.kb_keys)
+        self.kb_key2idx = {key: idx for idx, key in enumerate(self.kb_keys)}
         self.sos_token = start_of_sequence_token
         self.eos_token = end_of_sequence_token
         self.debug = debug
@@ -130,7 +131,6 @@ class Seq2SeqGoalOrientedBot(NNModel):
         b_dec_outs_np = self.tgt_vocab[self.eos_token] * \
                         np.ones((batch_size, max_tgt_len), dtype=np.float32)
         b_tgt_weights_np = np.zeros((batch_size, max_tgt_len), dtype=np.float32)
-        b_kb_masks_np = np.zeros((batch_size, self.kb_size), np.float32)
         for i, (src_len, tgt_len, kb_entries) in \
                 enumerate(zip(b_src_lens, b_tgt_lens, kb_entry_list)):
             b_enc_ins_np[i, :src_len] = b_enc_ins[i]
@@ -140,8 +140,7 @@ class Seq2SeqGoalOrientedBot(NNModel):
             if self.debug:
                 if len(kb_entries) != len(set([e[0] for e in kb_entries])):
                     log.debug("Duplicates in kb_entries = {}".format(kb_entries))
-            for k, v in kb_entries:
-                b_kb_masks_np[i, self.kb_keys.index(k)] = 1.
+        b_kb_masks_np = self._kb_masks(kb_entry_list)
 
         """if self.debug:
             log.debug("b_enc_ins = {}".format(b_enc_ins))
@@ -155,6 +154,17 @@ class Seq2SeqGoalOrientedBot(NNModel):
                                            b_src_lens, b_tgt_lens, b_tgt_weights_np,
                                            b_kb_masks_np)
 
+    def _kb_masks(self, kb_entry_list):
+        # collect all (utterance, key) positions and set them with one scatter
+        rows, cols = [], []
+        for i, kb_entries in enumerate(kb_entry_list):
+            for k, _ in kb_entries:
+                rows.append(i)
+                cols.append(self.kb_key2idx[k])
+        b_kb_masks_np = np.zeros((len(kb_entry_list), self.kb_size), dtype=np.float32)
+        b_kb_masks_np[rows, cols] = 1.
+        return b_kb_masks_np
+
     def _encode_context(self, tokens):
         if self.debug:
             log.debug("Context tokens = \"{}\"".format(tokens))
@@ -167,8 +177,9 @@ class Seq2SeqGoalOrientedBot(NNModel):
             log.debug("Response tokens = \"{}\"".format(tokens))
         token_idxs = []
         for token in tokens:
-            if token in self.kb_keys:
-                token_idxs.append(self.tgt_vocab_size + self.kb_keys.index(token))
+            kb_idx = self.kb_key2idx.get(token)
+            if kb_idx is not None:
+                token_idxs.append(self.tgt_vocab_size + kb_idx)
             else:
                 token_idxs.append(self.tgt_vocab[token])
         # token_idxs = self.tgt_vocab([tokens])[0]
@@ -179,7 +190,7 @@ class Seq2SeqGoalOrientedBot(NNModel):
         def _idx2token(idxs):
             for idx in idxs:
                 if idx < self.tgt_vocab_size:
-                    token = self.tgt_vocab([[idx]])[0][0]
+                    token = self.tgt_vocab[idx]
                     if token == self.eos_token:
                         break
                     yield token
@@ -208,13 +219,11 @@ class Seq2SeqGoalOrientedBot(NNModel):
         max_src_len = max(b_src_lens)
         b_enc_ins_np = np.zeros((batch_size, max_src_len, self.embedding_size),
                                 dtype=np.float32)
-        b_kb_masks_np = np.zeros((batch_size, self.kb_size), dtype=np.float32)
         for i, (src_len, kb_entries) in enumerate(zip(b_src_lens, kb_entry_list)):
             b_enc_ins_np[i, :src_len] = b_enc_ins[i]
             if self.debug:
                 log.debug("infer: kb_entries = {}".format(kb_entries))
-            for k, v in kb_entries:
-                b_kb_masks_np[i, self.kb_keys.index(k)] = 1.
+        b_kb_masks_np = self._kb_masks(kb_entry_list)
 
         pred_idxs = self.network(b_enc_ins_np, b_src_lens, b_kb_masks_np)
         preds = self._decode_response(pred_idxs)
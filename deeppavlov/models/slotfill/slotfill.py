@@ -80,15 +80,16 @@ class DstcSlotFillingNetwork(Component, Serializable):
         entities = []
         slots = []
         for token, tag in zip(tokens, tags):
-            curent_tag = tag.split('-')[-1].strip()
-            current_prefix = tag.split('-')[0]
-            if tag.startswith('B-'):
+            # prefix and slot name via partition/rpartition instead of two split() calls
+            current_prefix, sep, _ = tag.partition('-')
+            curent_tag = tag.rpartition('-')[2].strip()
+            if current_prefix == 'B' and sep:
                 if len(chunk_tokens) > 0:
                     entities.append(' '.join(chunk_tokens))
                     slots.append(prev_tag)
                     chunk_tokens = []
                 chunk_tokens.append(token)
-            if current_prefix == 'I':
+            elif current_prefix == 'I':
                 if curent_tag != prev_tag:
                     if len(chunk_tokens) > 0:
                         entities.append(' '.join(chunk_tokens))
@@ -96,7 +97,7 @@ class DstcSlotFillingNetwork(Component, Serializable):
                         chunk_tokens = []
                 else:
                     chunk_tokens.append(token)
-            if current_prefix == 'O':
+            elif current_prefix == 'O':
                 if len(chunk_tokens) > 0:
                     entities.append(' '.join(chunk_tokens))
                     slots.append(prev_tag)
@@ -45,7 +45,7 @@ class RussianTokenizer(Component):
          method
 
     Attributes:
-        stopwords: a list of stopwords that should be ignored during tokenizing/lemmatizing
+        stopwords: a set of stopwords that should be ignored during tokenizing/lemmatizing
          and ngrams creation
         tokenizer: an instance of :class:`ToktokTokenizer` tokenizer class
         lemmatizer: an instance of :class:`pymorphy2.MorphAnalyzer` lemmatizer class
@@ -65,7 +65,7 @@ class RussianTokenizer(Component):
 
         if ngram_range is None:
             ngram_range = [1, 1]
-        self.stopwords = stopwords or []
+        self.stopwords = frozenset(stopwords or [])
         self.tokenizer = ToktokTokenizer()
         self.lemmatizer = pymorphy2.MorphAnalyzer()
         self.ngram_range = tuple(ngram_range)  # cast JSON array to tuple
@@ -187,15 +187,14 @@ class RussianTokenizer(Component):
         else:
             _alphas_only = self.alphas_only
 
+        stopwords = self.stopwords
         if _alphas_only:
-            filter_fn = lambda x: x.isalpha() and not x.isspace() and x not in self.stopwords
-        else:
-            filter_fn = lambda x: not x.isspace() and x not in self.stopwords
-
-        return list(filter(filter_fn, items))
+            # isalpha() already rules out whitespace-only items
+            return [x for x in items if x.isalpha() and x not in stopwords]
+        return [x for x in items if not x.isspace() and x not in stopwords]
 
     def set_stopwords(self, stopwords: List[str]) -> None:
-        """Redefine a list of stopwords.
+        """Redefine a set of stopwords.
 
        Args:
            stopwords: a list of stopwords
@@ -204,4 +203,4 @@ class RussianTokenizer(Component):
            None
 
        """
-        self.stopwords = stopwords
+        self.stopwords = frozenset(stopwords or [])
@@ -62,7 +62,7 @@ class StreamSpacyTokenizer(Component):
 
 
     Attributes:
-        stopwords: a list of stopwords that should be ignored during tokenizing/lemmatizing
+        stopwords: a set of stopwords that should be ignored during tokenizing/lemmatizing
          and ngrams creation
         model: a loaded spacy model
         batch_size: a batch size for spaCy buffering
@@ -84,7 +84,7 @@ class StreamSpacyTokenizer(Component):
             disable = ['parser', 'ner']
         if ngram_range is None:
             ngram_range = [1, 1]
-        self.stopwords = stopwords or []
+        self.stopwords = frozenset(stopwords or [])
         self.model = _try_load_spacy_model(spacy_model, disable=disable)
         self.batch_size = batch_size
         self.ngram_range = tuple(ngram_range)  # cast JSON array to tuple
@@ -194,15 +194,14 @@ class StreamSpacyTokenizer(Component):
         else:
             _alphas_only = self.alphas_only
 
+        stopwords = self.stopwords
         if _alphas_only:
-            filter_fn = lambda x: x.isalpha() and not x.isspace() and x not in self.stopwords
-        else:
-            filter_fn = lambda x: not x.isspace() and x not in self.stopwords
-
-        return list(filter(filter_fn, items))
+            # isalpha() already rules out whitespace-only items
+            return [x for x in items if x.isalpha() and x not in stopwords]
+        return [x for x in items if not x.isspace() and x not in stopwords]
 
     def set_stopwords(self, stopwords: List[str]) -> None:
-        """Redefine a list of stopwords.
+        """Redefine a set of stopwords.
 
         Args:
             stopwords: a list of stopwords
@@ -211,4 +210,4 @@ class StreamSpacyTokenizer(Component):
             None
 
         """
-        self.stopwords = stopwords
+        self.stopwords = frozenset(stopwords or [])
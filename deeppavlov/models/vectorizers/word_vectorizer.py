@@ -60,7 +60,7 @@ class WordIndexVectorizer(Serializable, Component):
         # if isinstance(data[0], str):
         #     data = [[x for x in re.split("(\w+|[,.])", elem) if x.strip() != ""] for elem in data]
         max_length = max(len(x) for x in data)
-        answer = np.zeros(shape=(len(data), max_length, self.dim), dtype=int)
+        answer = np.zeros(shape=(len(data), max_length, self.dim), dtype=np.float32)
         for i, sent in enumerate(data):
             for j, word in enumerate(sent):
                 answer[i, j][self._get_word_indexes(word)] = 1